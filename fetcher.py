@@ -1,26 +1,32 @@
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import logging
 import time
 import re
-from urllib.parse import urljoin, urlparse, parse_qs, unquote
+import html
+from urllib.parse import urljoin, urlparse, unquote, unquote_plus, quote, urlencode
 import base64
 import json
+import orjson
 import hashlib
+import functools
+import hmac
 import random
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 import os
 import sys
 import traceback
-import urllib.parse
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Create uploads directory if it doesn't exist
 os.makedirs("uploads", exist_ok=True)
 
-# Configure logging with verbose output
+# Configure logging; set LOG_LEVEL=DEBUG for verbose request/response output
+LOG_LEVEL = (os.getenv('LOG_LEVEL') or 'INFO').upper()
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=LOG_LEVEL if LOG_LEVEL in ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL') else 'INFO',
     format='%(asctime)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s',
     handlers=[
         logging.StreamHandler(sys.stdout),
@@ -38,12 +44,7 @@ COUNTRY = os.getenv('COUNTRY')
 KEYWORD = os.getenv('KEYWORD', '')  # Optional keyword
 LICENSE_KEY = os.getenv('LICENSE_KEY', '')  # FIXED: License key for full data access
 
-# URL encode country and keyword for LinkedIn search
-COUNTRY_ENCODED = urllib.parse.quote(COUNTRY or 'Worldwide')
-KEYWORD_ENCODED = urllib.parse.quote(KEYWORD) if KEYWORD else ''
-
-logger.debug(f"Environment variables: WP_SITE_URL={WP_SITE_URL}, WP_USERNAME={WP_USERNAME}, WP_APP_PASSWORD={'***' if WP_APP_PASSWORD else None}, COUNTRY={COUNTRY}, KEYWORD={KEYWORD}, LICENSE_KEY={'***' if LICENSE_KEY else None}")
-logger.debug(f"Encoded search params: COUNTRY_ENCODED={COUNTRY_ENCODED}, KEYWORD_ENCODED={KEYWORD_ENCODED}")
+logger.debug("Environment variables: WP_SITE_URL=%s, WP_USERNAME=%s, WP_APP_PASSWORD=%s, COUNTRY=%s, KEYWORD=%s, LICENSE_KEY=%s", WP_SITE_URL, WP_USERNAME, '***' if WP_APP_PASSWORD else None, COUNTRY, KEYWORD, '***' if LICENSE_KEY else None)
 
 # Constants for WordPress
 WP_URL = f"{WP_SITE_URL}/wp-json/wp/v2/job-listings" if WP_SITE_URL else None
@@ -56,28 +57,59 @@ WP_SAVE_JOB_URL = f"{WP_SITE_URL}/wp-json/fetcher/v1/save-job" if WP_SITE_URL el
 WP_FETCHER_STATUS_URL = f"{WP_SITE_URL}/wp-json/fetcher/v1/get-status" if WP_SITE_URL else None
 WP_CREDENTIALS_URL = f"{WP_SITE_URL}/wp-json/fetcher/v1/get-credentials" if WP_SITE_URL else None
 
-PROCESSED_IDS_FILE = os.path.join("uploads", "processed_job_ids.json")
+PROCESSED_IDS_FILE = os.path.join("uploads", "processed_job_ids.txt")
+LEGACY_PROCESSED_IDS_FILE = os.path.join("uploads", "processed_job_ids.json")
 LAST_PAGE_FILE = os.path.join("uploads", "last_processed_page.txt")
 
-# HTTP headers for scraping
+# C-backed parser for BeautifulSoup (lxml is already a dependency)
+HTML_PARSER = 'lxml'
+
+# Only the results list is needed from a search page, so skip building the rest of the tree
+SEARCH_RESULTS_STRAINER = SoupStrainer('ul', class_='jobs-search__results-list')
+
+# Minimum seconds between two requests to the same host
+HOST_MIN_INTERVAL = 5
+
+# Jobs from one search page that are scraped concurrently, and WordPress saves in flight
+JOB_WORKERS = 4
+WP_WORKERS = 2
+# Application pages are read in chunks of this size while looking for an email
+EMAIL_STREAM_CHUNK_SIZE = 64 * 1024
+EMAIL_STREAM_OVERLAP = 256
+# Company pages parsed per run; jobs at the same employer reuse the entry
+COMPANY_CACHE_SIZE = 1024
+
+# HTTP headers for scraping; Accept-Encoding is left to requests, which adds br when brotli is installed
 headers = {
-    'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+    'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    # English page chrome keeps job criteria and "Show more" labels in the form the cleanup expects
+    'accept-language': 'en-US,en;q=0.9'
 }
 
+# Scraping GETs are idempotent, so every transient status is retried with exponential backoff
+SCRAPE_RETRIES = Retry(total=3, backoff_factor=1, status_forcelist=[429, 500, 502, 503, 504])
+# WordPress saves are POSTs: only retry statuses that mean the request was not processed,
+# and never once the request was sent but reading the reply failed
+WP_RETRIES = Retry(total=3, read=0, backoff_factor=1, status_forcelist=[429, 503], allowed_methods=frozenset(['POST']))
+
+def create_http_session(retries):
+    """Create a pooled HTTP session with retries on transient errors"""
+    session = requests.Session()
+    session.headers.update(headers)
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retries)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+# Module-level sessions so keep-alive connections are reused across every request;
+# WordPress gets its own pool so its credentials never travel with scraping requests
+SESSION = create_http_session(SCRAPE_RETRIES)
+WP_SESSION = create_http_session(WP_RETRIES)
+
 # FIXED: Valid license key for full data scraping
 VALID_LICENSE_KEY = "A1B2C-3D4E5-F6G7H-8I9J0-K1L2M-3N4O5"
 UNLICENSED_MESSAGE = 'Get license: https://mimusjobs.com/job-fetcher'
 
-JOB_TYPE_MAPPING = {
-    "Full-time": "full-time",
-    "Part-time": "part-time",
-    "Contract": "contract",
-    "Temporary": "temporary",
-    "Freelance": "freelance",
-    "Internship": "internship",
-    "Volunteer": "volunteer"
-}
-
 FRENCH_TO_ENGLISH_JOB_TYPE = {
     "Temps plein": "Full-time",
     "Temps partiel": "Part-time",
@@ -88,9 +120,80 @@ FRENCH_TO_ENGLISH_JOB_TYPE = {
     "Bénévolat": "Volunteer"
 }
 
-logger.debug(f"WordPress URLs configured: SAVE_JOB={WP_SAVE_JOB_URL}, SAVE_COMPANY={WP_SAVE_COMPANY_URL}")
-logger.debug(f"Job type mappings: {JOB_TYPE_MAPPING}")
-logger.debug(f"French to English job type mappings: {FRENCH_TO_ENGLISH_JOB_TYPE}")
+# Precompiled regular expressions used on the scraping hot path
+# One-pass text cleanup: HTML tags are dropped and "word.word" becomes "word. word";
+# the description variant also drops a trailing "Show more"/"Show less" toggle label
+CLEANUP_RE = re.compile(r'<[^>]+>|(\w)\.(\w)')
+DESCRIPTION_CLEANUP_RE = re.compile(r'<[^>]+>|(\w)\.(\w)|(?i:\s*Show\s+(?:more|less)\s*$)')
+EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+EMAIL_BYTES_RE = re.compile(EMAIL_RE.pattern.encode())
+# Application pages are only scanned for links, so they are matched in the raw bytes instead of parsed
+ANCHOR_HREF_RE = re.compile(rb'<a\s[^>]*?(?<=\s)href\s*=\s*(["\'])(.*?)\1', re.IGNORECASE | re.DOTALL)
+APPLICATION_LINK_RE = re.compile(r'apply|careers|jobs', re.IGNORECASE)
+# EMAIL_RE matches that are file names rather than addresses
+NON_EMAIL_SUFFIXES = ('.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp', '.css', '.js')
+ERROR_HOST_RE = re.compile(r'host=\'([^\']+)\'')
+EXTERNAL_URL_RE = re.compile(r'https?://(?!www\.linkedin\.com)[^\s]+')
+
+# Boilerplate paragraphs dropped from job descriptions (matched lowercased)
+UNWANTED_DESCRIPTION_PHRASES = [phrase.lower() for phrase in [
+    "Never Miss a Job Update Again",
+    "Don't Keep! Kindly Share:",
+    "We have started building our professional LinkedIn page"
+]]
+
+# Fields sent with the same value on every company and job payload
+WP_CONSTANT_FIELDS = {
+    "company_twitter": "",
+    "company_video": ""
+}
+
+# WordPress payload fields copied from scraped job data: (payload key, job data key, cleanup)
+# cleanup is "text" (sanitize_text), "url" (sanitize_text as URL) or "raw" (as scraped,
+# falling back to the unlicensed message when missing)
+WP_COMPANY_FIELDS = [
+    ("company_details", "company_details", "raw"),
+    ("company_logo", "company_logo", "url"),
+    ("company_website", "company_website_url", "url"),
+    ("company_industry", "company_industry", "text"),
+    ("company_founded", "company_founded", "text"),
+    ("company_type", "company_type", "text"),
+    ("company_address", "company_address", "text"),
+    ("company_tagline", "company_details", "text"),
+]
+
+WP_JOB_FIELDS = [
+    ("job_description", "job_description", "raw"),
+    ("job_type", "job_type", "text"),
+    ("job_url", "job_url", "url"),
+    ("environment", "environment", "text"),
+    ("job_salary", "job_salary", "text"),
+    ("company_website_url", "company_website_url", "url"),
+    ("company_logo", "company_logo", "url"),
+    ("company_details", "company_details", "raw"),
+    ("company_address", "company_address", "raw"),
+    ("company_industry", "company_industry", "text"),
+    ("company_founded", "company_founded", "text"),
+]
+
+logger.debug("WordPress URLs configured: SAVE_JOB=%s, SAVE_COMPANY=%s", WP_SAVE_JOB_URL, WP_SAVE_COMPANY_URL)
+logger.debug("French to English job type mappings: %s", FRENCH_TO_ENGLISH_JOB_TYPE)
+
+# Per-host rate limiting: next allowed request time keyed by hostname
+HOST_NEXT_REQUEST = {}
+HOST_THROTTLE_LOCK = threading.Lock()
+
+def throttle_host(url, min_interval=HOST_MIN_INTERVAL):
+    """Wait until at least min_interval seconds have passed since the last request to url's host."""
+    host = urlparse(url).hostname or ''
+    with HOST_THROTTLE_LOCK:
+        now = time.monotonic()
+        slot = max(now, HOST_NEXT_REQUEST.get(host, 0))
+        HOST_NEXT_REQUEST[host] = slot + min_interval
+    delay = slot - now
+    if delay > 0:
+        logger.debug("throttle_host: Waiting %.2fs before requesting %s", delay, host)
+        time.sleep(delay)
 
 def validate_license_key(license_key):
     """Validate license key - exact match required"""
@@ -98,12 +201,12 @@ def validate_license_key(license_key):
         logger.warning("No LICENSE_KEY provided")
         return False
     
-    # Exact match validation
-    if license_key.strip() == VALID_LICENSE_KEY:
-        logger.info(f"✅ License key validated successfully: {VALID_LICENSE_KEY[:8]}...")
+    # Exact match validation in constant time (bytes, so non-ASCII input cannot raise)
+    if hmac.compare_digest(license_key.strip().encode(), VALID_LICENSE_KEY.encode()):
+        logger.info("✅ License key validated successfully: %s...", VALID_LICENSE_KEY[:8])
         return True
     
-    logger.warning(f"❌ Invalid LICENSE_KEY. Expected: {VALID_LICENSE_KEY[:8]}... Got: {license_key[:8]}...")
+    logger.warning("❌ Invalid LICENSE_KEY. Expected: %s... Got: %s...", VALID_LICENSE_KEY[:8], license_key[:8])
     return False
 
 def get_license_status():
@@ -136,20 +239,20 @@ def validate_environment():
     
     # LICENSE_KEY is optional
     if missing:
-        logger.error(f"Missing required environment variables: {', '.join(missing)}")
+        logger.error("Missing required environment variables: %s", ', '.join(missing))
         raise ValueError(f"Missing required environment variables: {', '.join(missing)}")
     
     logger.info("All required environment variables validated successfully")
-    logger.info(f"Search configuration: Country='{COUNTRY}', Keyword='{KEYWORD or 'ALL JOBS'}'")
-    logger.info(f"License key received: {'Yes' if LICENSE_KEY else 'No'}")
+    logger.info("Search configuration: Country='%s', Keyword='%s'", COUNTRY, KEYWORD or 'ALL JOBS')
+    logger.info("License key received: %s", 'Yes' if LICENSE_KEY else 'No')
     return True
 
 def build_search_url(page=0):
     """Build LinkedIn search URL with optional keyword"""
     base_url = 'https://www.linkedin.com/jobs/search'
     params = {
-        'keywords': KEYWORD_ENCODED,
-        'location': COUNTRY_ENCODED,
+        'keywords': KEYWORD,
+        'location': COUNTRY or 'Worldwide',
         'start': str(page * 25)
     }
     
@@ -157,13 +260,18 @@ def build_search_url(page=0):
     if not KEYWORD:
         params.pop('keywords', None)
     
-    query_string = '&'.join([f"{k}={v}" for k, v in params.items()])
-    url = f"{base_url}?{query_string}"
+    # Encode every value in one place; quote keeps spaces as %20 like LinkedIn's own links
+    url = f"{base_url}?{urlencode(params, quote_via=quote)}"
     
-    logger.debug(f"Built search URL for page {page}: {url}")
+    logger.debug("Built search URL for page %s: %s", page, url)
     return url
 
-def sanitize_text(text, is_url=False):
+def replace_cleanup_match(match):
+    if match.group(1):
+        return f"{match.group(1)}. {match.group(2)}"
+    return ''
+
+def sanitize_text(text, is_url=False, is_description=False):
     if not text:
         return ''
     if is_url:
@@ -171,18 +279,78 @@ def sanitize_text(text, is_url=False):
         if not text.startswith(('http://', 'https://')):
             text = 'https://' + text
         return text
-    text = re.sub(r'<[^>]+>', '', text)
-    text = re.sub(r'(\w)\.(\w)', r'\1. \2', text)
-    text = re.sub(r'(\w)(\w)', r'\1 \2', text) if re.match(r'^\w+$', text) else text
+    cleanup_re = DESCRIPTION_CLEANUP_RE if is_description else CLEANUP_RE
+    text = cleanup_re.sub(replace_cleanup_match, text)
     text = ' '.join(text.split())
     return text
 
+class DeduplicationTable(dict):
+    """str.translate table that drops every non-word character, filled lazily per code point"""
+    def __missing__(self, codepoint):
+        char = chr(codepoint)
+        value = codepoint if char.isalnum() or char == '_' else None
+        self[codepoint] = value
+        return value
+
+DEDUPLICATION_TABLE = DeduplicationTable()
+
 def normalize_for_deduplication(text):
     if not text:
         return ''
-    text = re.sub(r'[^\w\s]', '', text)
-    text = re.sub(r'\s+', '', text)
-    return text.lower()
+    return text.translate(DEDUPLICATION_TABLE).lower()
+
+def get_query_param(url, name):
+    """Return the first non-blank value of one query parameter (None if absent), like parse_qs(...)[name][0]"""
+    query = url.partition('?')[2].split('#', 1)[0]
+    for pair in query.split('&'):
+        key, _, value = pair.partition('=')
+        if value and unquote_plus(key) == name:
+            return unquote_plus(value)
+    return None
+
+def is_email_lookalike(email, prefix):
+    """True for EMAIL_RE matches that are asset names ("logo@2x.png") or credentials
+    embedded in URLs ("https://key@host"); prefix is the text just before the match"""
+    return email.lower().endswith(NON_EMAIL_SUFFIXES) or prefix.endswith('//')
+
+def find_email(text):
+    """Return the first email address in text, skipping look-alikes"""
+    for match in EMAIL_RE.finditer(text):
+        email = match.group(0)
+        if not is_email_lookalike(email, text[max(0, match.start() - 2):match.start()]):
+            return email
+    return ''
+
+def find_email_in_stream(response):
+    """Scan a streamed response body for an email without decoding it, stopping at the
+    first hit; returns (email or '', bytes read so far)"""
+    body = bytearray()
+    pos = 0
+    chunks = response.iter_content(EMAIL_STREAM_CHUNK_SIZE)
+    while True:
+        chunk = next(chunks, None)
+        if chunk is not None:
+            body += chunk
+        # A match ending near the end of an unfinished body might still grow, so leave it for the next chunk
+        limit = len(body) if chunk is None else len(body) - EMAIL_STREAM_OVERLAP
+        for match in EMAIL_BYTES_RE.finditer(body, pos):
+            if match.end() > limit:
+                break
+            email = match.group(0).decode('ascii')
+            if not is_email_lookalike(email, body[max(0, match.start() - 2):match.start()].decode('latin-1')):
+                return email, bytes(body)
+        if chunk is None:
+            return '', bytes(body)
+        # Resume from the last tag boundary; '<' can never be part of a match
+        pos = max(pos, body.rfind(b'<', pos, max(pos, limit)))
+
+def find_application_link(content):
+    """Return the first <a href> in raw page bytes that points at an apply/careers/jobs page, or ''"""
+    for match in ANCHOR_HREF_RE.finditer(content):
+        href = html.unescape(match.group(2).decode('utf-8', 'replace'))
+        if APPLICATION_LINK_RE.search(href):
+            return href
+    return ''
 
 def generate_id(combined):
     if not combined:
@@ -190,25 +358,45 @@ def generate_id(combined):
     id_hash = hashlib.md5(combined.encode()).hexdigest()[:16]
     return id_hash
 
-def split_paragraphs(text, max_length=200):
-    if not text:
-        return ''
-    paragraphs = text.split('\n\n')
-    result = []
-    for para in paragraphs:
-        para = para.strip()
+def iter_unique_paragraphs(raw_text, job_title=''):
+    """Yield cleaned description paragraphs, skipping unwanted boilerplate and duplicates"""
+    seen = set()
+    for para in raw_text.split('\n\n'):
+        lowered = para.lower()
+        if any(phrase in lowered for phrase in UNWANTED_DESCRIPTION_PHRASES):
+            continue
+        para = sanitize_text(para, is_description=True)
         if not para:
             continue
-        while len(para) > max_length:
-            split_point = para.rfind(' ', 0, max_length)
-            if split_point == -1:
-                split_point = para.rfind('.', 0, max_length)
-            if split_point == -1:
-                split_point = max_length
-            result.append(para[:split_point].strip())
-            para = para[split_point:].strip()
-        if para:
-            result.append(para)
+        norm_para = normalize_for_deduplication(para)
+        if norm_para and norm_para not in seen:
+            seen.add(norm_para)
+            logger.debug("iter_unique_paragraphs: Added unique paragraph: %s...", para[:50])
+            yield para
+        elif norm_para:
+            logger.info("iter_unique_paragraphs: Removed duplicate paragraph for %s: %s...", job_title, para[:50])
+
+def split_paragraphs(paragraphs, max_length=200):
+    """Join cleaned paragraphs with blank lines, breaking any longer than max_length
+
+    Paragraphs must already be whitespace-normalized (as sanitize_text leaves them),
+    so chunks never need stripping and at most one space separates them.
+    """
+    result = []
+    for para in paragraphs:
+        # Walk split points by offset instead of re-slicing the remaining text on every split
+        start = 0
+        while len(para) - start > max_length:
+            end = start + max_length
+            split_point = para.rfind(' ', start, end)
+            if split_point <= start:
+                split_point = para.rfind('.', start, end)
+                if split_point <= start:
+                    split_point = end
+            result.append(para[start:split_point])
+            # Drop the separating space; a '.' break point stays with the next chunk
+            start = split_point + (para[split_point] == ' ')
+        result.append(para[start:])
     return '\n\n'.join(result)
 
 def create_wp_auth_headers():
@@ -225,7 +413,23 @@ def create_wp_auth_headers():
     logger.debug("Created WordPress auth headers successfully")
     return wp_headers
 
-def save_company_to_wordpress(index, company_data, wp_headers, licensed):
+def build_wp_payload(payload, fields, data, licensed):
+    """Fill a WordPress payload from a field table"""
+    fallback = "" if licensed else UNLICENSED_MESSAGE
+    payload.update(WP_CONSTANT_FIELDS)
+    for payload_key, data_key, cleanup in fields:
+        if cleanup == "raw":
+            payload[payload_key] = data.get(data_key, fallback)
+        else:
+            payload[payload_key] = sanitize_text(data.get(data_key, ""), is_url=(cleanup == "url"))
+    return payload
+
+# WordPress post IDs of companies saved during this run, keyed by company_id.
+# Only saves built from a successfully scraped company page are cached, so a
+# later job can still post the full details after a failed company fetch.
+SAVED_COMPANY_IDS = {}
+
+def save_company_to_wordpress(index, company_data, licensed):
     if not WP_SAVE_COMPANY_URL:
         logger.error("WP_SAVE_COMPANY_URL not configured")
         return None, "WordPress company endpoint not configured"
@@ -235,36 +439,32 @@ def save_company_to_wordpress(index, company_data, wp_headers, licensed):
         return None, "No company name"
     
     company_id = generate_id(company_name)
-    post_data = {
+    if company_id in SAVED_COMPANY_IDS:
+        logger.debug("Company %s already saved this run", company_name)
+        return SAVED_COMPANY_IDS[company_id], "Company already saved"
+    
+    post_data = build_wp_payload({
         "company_id": company_id,
-        "company_name": sanitize_text(company_name),
-        "company_details": company_data.get("company_details", UNLICENSED_MESSAGE if not licensed else ""),
-        "company_logo": sanitize_text(company_data.get("company_logo", ""), is_url=True),
-        "company_website": sanitize_text(company_data.get("company_website_url", ""), is_url=True),
-        "company_industry": sanitize_text(company_data.get("company_industry", "")),
-        "company_founded": sanitize_text(company_data.get("company_founded", "")),
-        "company_type": sanitize_text(company_data.get("company_type", "")),
-        "company_address": sanitize_text(company_data.get("company_address", "")),
-        "company_tagline": sanitize_text(company_data.get("company_details", "")),
-        "company_twitter": "",
-        "company_video": ""
-    }
+        "company_name": sanitize_text(company_name)
+    }, WP_COMPANY_FIELDS, company_data, licensed)
     
     try:
-        response = requests.post(WP_SAVE_COMPANY_URL, json=post_data, headers=wp_headers, timeout=15)
+        response = WP_SESSION.post(WP_SAVE_COMPANY_URL, data=orjson.dumps(post_data), timeout=15)
         response.raise_for_status()
-        post = response.json()
+        post = orjson.loads(response.content)
         if post.get('success'):
-            logger.info(f"Successfully saved company {company_name}")
+            logger.info("Successfully saved company %s", company_name)
+            if post.get("id") and company_data.get("company_scraped"):
+                SAVED_COMPANY_IDS[company_id] = post.get("id")
             return post.get("id"), post.get("message", "Company saved successfully")
         else:
-            logger.warning(f"Company {company_name} save failed: {post.get('message')}")
+            logger.warning("Company %s save failed: %s", company_name, post.get('message'))
             return None, post.get("message", "Company save failed")
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Failed to save company {company_name}: {str(e)}")
+    except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+        logger.error("Failed to save company %s: %s", company_name, e)
         return None, f"Request failed: {str(e)}"
 
-def save_article_to_wordpress(index, job_data, company_id, wp_headers, licensed):
+def save_article_to_wordpress(index, job_data, job_id, company_id, licensed):
     if not WP_SAVE_JOB_URL:
         logger.error("WP_SAVE_JOB_URL not configured")
         return None, "WordPress job endpoint not configured"
@@ -274,7 +474,6 @@ def save_article_to_wordpress(index, job_data, company_id, wp_headers, licensed)
         return None, "No job title"
     
     company_name = job_data.get("company_name", "")
-    job_id = generate_id(f"{job_title}_{company_name}")
     
     # Determine application method
     application = ''
@@ -286,60 +485,47 @@ def save_article_to_wordpress(index, job_data, company_id, wp_headers, licensed)
     else:
         application = job_data.get("application_url", "")
     
-    post_data = {
+    post_data = build_wp_payload({
         "job_id": job_id,
         "job_title": sanitize_text(job_title),
-        "job_description": job_data.get("job_description", UNLICENSED_MESSAGE if not licensed else ""),
-        "job_type": sanitize_text(job_data.get("job_type", "")),
         "location": sanitize_text(job_data.get("location", COUNTRY or "Worldwide")),
-        "job_url": sanitize_text(job_data.get("job_url", ""), is_url=True),
-        "environment": sanitize_text(job_data.get("environment", "")),
-        "job_salary": sanitize_text(job_data.get("job_salary", "")),
         "application": sanitize_text(application, is_url=('@' not in application)),
         "company_id": company_id,
-        "company_name": sanitize_text(company_name),
-        "company_website_url": sanitize_text(job_data.get("company_website_url", ""), is_url=True),
-        "company_logo": sanitize_text(job_data.get("company_logo", ""), is_url=True),
-        "company_details": job_data.get("company_details", UNLICENSED_MESSAGE if not licensed else ""),
-        "company_address": job_data.get("company_address", UNLICENSED_MESSAGE if not licensed else ""),
-        "company_industry": sanitize_text(job_data.get("company_industry", "")),
-        "company_founded": sanitize_text(job_data.get("company_founded", "")),
-        "company_twitter": "",
-        "company_video": ""
-    }
+        "company_name": sanitize_text(company_name)
+    }, WP_JOB_FIELDS, job_data, licensed)
     
     try:
-        response = requests.post(WP_SAVE_JOB_URL, json=post_data, headers=wp_headers, timeout=15)
+        response = WP_SESSION.post(WP_SAVE_JOB_URL, data=orjson.dumps(post_data), timeout=15)
         response.raise_for_status()
-        post = response.json()
+        post = orjson.loads(response.content)
         if post.get('success'):
-            logger.info(f"Successfully saved job {job_title}")
+            logger.info("Successfully saved job %s", job_title)
             return post.get("id"), post.get("message", "Job saved successfully")
         else:
-            logger.warning(f"Job {job_title} save failed: {post.get('message')}")
+            logger.warning("Job %s save failed: %s", job_title, post.get('message'))
             return None, post.get("message", "Job save failed")
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Failed to save job {job_title}: {str(e)}")
+    except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+        logger.error("Failed to save job %s: %s", job_title, e)
         return None, f"Request failed: {str(e)}"
 
 def load_processed_ids():
     processed_ids = set()
     try:
+        # IDs from older runs were stored as a single JSON list
+        if os.path.exists(LEGACY_PROCESSED_IDS_FILE):
+            with open(LEGACY_PROCESSED_IDS_FILE, "r") as f:
+                processed_ids.update(json.load(f))
         if os.path.exists(PROCESSED_IDS_FILE):
             with open(PROCESSED_IDS_FILE, "r") as f:
-                processed_ids = set(json.load(f))
-            logger.info(f"Loaded {len(processed_ids)} processed job IDs")
+                processed_ids.update(f.read().split())
+        logger.info("Loaded %s processed job IDs", len(processed_ids))
     except Exception as e:
-        logger.error(f"Failed to load processed IDs: {str(e)}")
+        logger.error("Failed to load processed IDs: %s", e)
     return processed_ids
 
-def save_processed_ids(processed_ids):
-    try:
-        with open(PROCESSED_IDS_FILE, "w") as f:
-            json.dump(list(processed_ids), f)
-        logger.info(f"Saved {len(processed_ids)} job IDs")
-    except Exception as e:
-        logger.error(f"Failed to save processed IDs: {str(e)}")
+def open_processed_ids_log():
+    """Open the processed job ID log for buffered, append-only writes (one ID per line)"""
+    return open(PROCESSED_IDS_FILE, "a", buffering=1 << 16)
 
 def load_last_page():
     try:
@@ -347,164 +533,293 @@ def load_last_page():
             with open(LAST_PAGE_FILE, "r") as f:
                 return int(f.read().strip())
     except Exception as e:
-        logger.error(f"Failed to load last page: {str(e)}")
+        logger.error("Failed to load last page: %s", e)
     return 0
 
-def save_last_page(page):
+def open_last_page_file():
+    """Open the last-page file once per crawl without truncating it, so a crash keeps the previous value"""
+    return open(os.open(LAST_PAGE_FILE, os.O_WRONLY | os.O_CREAT, 0o644), "wb", buffering=0)
+
+def save_last_page(last_page_file, page):
     try:
-        with open(LAST_PAGE_FILE, "w") as f:
-            f.write(str(page))
-        logger.info(f"Saved last processed page: {page}")
+        data = str(page).encode()
+        # Overwrite in place: one positioned write, then drop any longer previous value
+        os.pwrite(last_page_file.fileno(), data, 0)
+        last_page_file.truncate(len(data))
+        logger.info("Saved last processed page: %s", page)
     except Exception as e:
-        logger.error(f"Failed to save last page: {str(e)}")
+        logger.error("Failed to save last page: %s", e)
+
+def parse_html(response, parse_only=None):
+    """Parse a response body from raw bytes, avoiding requests' text decoding and charset guessing"""
+    # Only trust the header encoding when the server sent one; otherwise lxml reads <meta charset>
+    content_type = response.headers.get('content-type', '').lower()
+    from_encoding = response.encoding if 'charset' in content_type else None
+    return BeautifulSoup(response.content, HTML_PARSER, from_encoding=from_encoding, parse_only=parse_only)
+
+# Company pages are fetched on their own pool so a job's company and application pages load in parallel
+COMPANY_EXECUTOR = ThreadPoolExecutor(max_workers=JOB_WORKERS)
+
+@functools.lru_cache(maxsize=COMPANY_CACHE_SIZE)
+def scrape_company_details(company_url):
+    """Fetch and parse a LinkedIn company page into a dict of company fields.
+    Cached for the run since many jobs share an employer; failures raise and are not cached"""
+    logger.info("scrape_company_details: Fetching company page: %s", company_url)
+    # Transient failures are retried with backoff by the session's adapter
+    throttle_host(company_url)
+    company_response = SESSION.get(company_url, timeout=15)
+    logger.debug("scrape_company_details: Company page GET response status=%s, headers=%s", company_response.status_code, company_response.headers)
+    company_response.raise_for_status()
+    company_soup = parse_html(company_response)
+
+    # Scrape company details using data-test-id
+    company_details_elem = company_soup.select_one("p[data-test-id='about-us__description']")
+    company_details = company_details_elem.get_text().strip() if company_details_elem else ''
+    logger.info("scrape_company_details: Scraped Company Details: %.100s%s", company_details, '...' if company_details else '')
+
+    # Collect every about-us__<label> detail row in a single pass, picking up the website link on the way
+    company_detail_values = {}
+    company_website_anchor = None
+    for detail_div in company_soup.select("div[data-test-id^='about-us__']"):
+        label = detail_div['data-test-id'][len('about-us__'):].lower()
+        dd = detail_div.find("dd")
+        company_detail_values[label] = dd.get_text().strip() if dd else ''
+        if label == 'website' and dd and not company_website_anchor:
+            company_website_anchor = dd.find("a", href=True)
+    company_website_url = company_website_anchor['href'] if company_website_anchor else ''
+    logger.info("scrape_company_details: Scraped Company Website URL: %s", company_website_url)
+
+    # Handle LinkedIn redirect URLs
+    if 'linkedin.com/redir/redirect' in company_website_url:
+        redirect_target = get_query_param(company_website_url, 'url')
+        if redirect_target is not None:
+            company_website_url = unquote(redirect_target)
+            logger.info("scrape_company_details: Extracted external company website from redirect: %s", company_website_url)
+        else:
+            logger.warning("scrape_company_details: No 'url' param in LinkedIn redirect for %s", company_url)
+
+    # Resolve external company website
+    if company_website_url and 'linkedin.com' not in company_website_url:
+        logger.debug("scrape_company_details: Following company website URL: %s", company_website_url)
+        try:
+            throttle_host(company_website_url)
+            resp_company_web = SESSION.get(company_website_url, timeout=15, allow_redirects=True)
+            logger.debug("scrape_company_details: Company website GET response status=%s, headers=%s, final_url=%s", resp_company_web.status_code, resp_company_web.headers, resp_company_web.url)
+            company_website_url = resp_company_web.url
+            logger.info("scrape_company_details: Resolved Company Website URL: %s", company_website_url)
+        except Exception as e:
+            logger.error("scrape_company_details: Failed to resolve company website URL: %s", e, exc_info=True)
+            error_str = str(e)
+            external_url_match = ERROR_HOST_RE.search(error_str)
+            if external_url_match:
+                external_url = external_url_match.group(1)
+                company_website_url = f"https://{external_url}"
+                logger.info("scrape_company_details: Extracted external URL from error for company website: %s", company_website_url)
+            else:
+                logger.warning("scrape_company_details: No external URL found in error for %s", company_url)
+                company_website_url = ''
+    else:
+        # Try to find website in company description
+        if company_details:
+            urls = EXTERNAL_URL_RE.findall(company_details)
+            if urls:
+                company_website_url = urls[0]
+                logger.info("scrape_company_details: Found company website in description: %s", company_website_url)
+                try:
+                    throttle_host(company_website_url)
+                    resp_company_web = SESSION.get(company_website_url, timeout=15, allow_redirects=True)
+                    logger.debug("scrape_company_details: Company website description GET response status=%s, headers=%s, final_url=%s", resp_company_web.status_code, resp_company_web.headers, resp_company_web.url)
+                    company_website_url = resp_company_web.url
+                    logger.info("scrape_company_details: Resolved Company Website URL from description: %s", company_website_url)
+                except Exception as e:
+                    logger.error("scrape_company_details: Failed to resolve company website URL from description: %s", e, exc_info=True)
+                    company_website_url = ''
+            else:
+                logger.warning("scrape_company_details: No valid company website URL found in description for %s", company_url)
+                company_website_url = ''
+        else:
+            logger.warning("scrape_company_details: No company description found for %s", company_url)
+            company_website_url = ''
+
+    # Skip LinkedIn URLs
+    if company_website_url and 'linkedin.com' in company_website_url:
+        logger.warning("scrape_company_details: Skipping LinkedIn URL for company website: %s", company_website_url)
+        company_website_url = ''
+
+    # Helper function to get company details
+    def get_company_detail(label):
+        value = company_detail_values.get(label.lower())
+        if value is None:
+            logger.debug("scrape_company_details: No %s found in company details", label)
+            return ''
+        logger.debug("scrape_company_details: Found %s='%s'", label, value)
+        return value
 
-def scrape_job_details(job_url, licensed, session):
-    """Scrape detailed job information from LinkedIn job page"""
-    logger.debug(f"scrape_job_details called with job_url={job_url}, licensed={licensed}")
+    company_industry = get_company_detail("industry")
+    logger.info("scrape_company_details: Scraped Company Industry: %s", company_industry)
+    company_size = get_company_detail("size")
+    logger.info("scrape_company_details: Scraped Company Size: %s", company_size)
+    company_headquarters = get_company_detail("headquarters")
+    logger.info("scrape_company_details: Scraped Company Headquarters: %s", company_headquarters)
+    company_type = get_company_detail("organizationType")
+    logger.info("scrape_company_details: Scraped Company Type: %s", company_type)
+    company_founded = get_company_detail("foundedOn")
+    logger.info("scrape_company_details: Scraped Company Founded: %s", company_founded)
+    company_specialties = get_company_detail("specialties")
+    logger.info("scrape_company_details: Scraped Company Specialties: %s", company_specialties)
+
+    # For address, get primary location
+    primary_li = company_soup.select_one("li span.tag-sm.tag-enabled")
+    if primary_li:
+        address_div = primary_li.find_next_sibling("div")
+        if address_div:
+            company_address = address_div.get_text(separator=', ', strip=True)
+            logger.info("scrape_company_details: Scraped Primary Company Address: %s", company_address)
+        else:
+            company_address = company_headquarters
+            logger.warning("scrape_company_details: No address div found, using headquarters: %s", company_address)
+    else:
+        company_address = company_headquarters
+        logger.warning("scrape_company_details: No primary location found, using headquarters: %s", company_address)
+    
+    return {
+        "company_details": company_details,
+        "company_website_url": company_website_url,
+        "company_industry": company_industry,
+        "company_size": company_size,
+        "company_headquarters": company_headquarters,
+        "company_type": company_type,
+        "company_founded": company_founded,
+        "company_specialties": company_specialties,
+        "company_address": company_address
+    }
+
+def scrape_job_details(job_url, licensed):
+    """Scrape detailed job information from LinkedIn job page; returns a dict of job fields or None"""
+    logger.debug("scrape_job_details called with job_url=%s, licensed=%s", job_url, licensed)
     try:
-        logger.debug(f"scrape_job_details: Sending GET request to {job_url} with headers={headers}")
-        response = session.get(job_url, headers=headers, timeout=15)
-        logger.debug(f"scrape_job_details: GET response status={response.status_code}, headers={response.headers}")
+        logger.debug("scrape_job_details: Sending GET request to %s with headers=%s", job_url, SESSION.headers)
+        throttle_host(job_url)
+        response = SESSION.get(job_url, timeout=15)
+        logger.debug("scrape_job_details: GET response status=%s, headers=%s", response.status_code, response.headers)
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = parse_html(response)
         
         # Job title
         job_title = soup.select_one("h1.top-card-layout__title")
         job_title = job_title.get_text().strip() if job_title else ''
-        logger.info(f"scrape_job_details: Scraped Job Title: {job_title}")
+        logger.info("scrape_job_details: Scraped Job Title: %s", job_title)
         
         # Company logo
         company_logo_elem = soup.select_one("img.artdeco-entity-image.artdeco-entity-image--square-5")
         company_logo = company_logo_elem.get('src') if company_logo_elem and company_logo_elem.get('src') else ''
         if company_logo and 'media.licdn.com' in company_logo:
             # Remove query parameters
-            company_logo = re.sub(r'\?.*$', '', company_logo)
+            company_logo = company_logo.split('?', 1)[0]
             # Ensure the URL ends with .jpg
             if not company_logo.lower().endswith(('.jpg', '.jpeg', '.png', '.gif')):
                 company_logo = f"{company_logo}.jpg"
             # Validate the logo URL
             try:
-                logo_response = session.head(company_logo, headers=headers, timeout=5)
+                throttle_host(company_logo)
+                logo_response = SESSION.head(company_logo, timeout=5)
                 content_type = logo_response.headers.get('content-type', '')
                 if 'image' not in content_type.lower():
-                    logger.warning(f"scrape_job_details: Logo URL {company_logo} is not an image (Content-Type: {content_type})")
+                    logger.warning("scrape_job_details: Logo URL %s is not an image (Content-Type: %s)", company_logo, content_type)
                     company_logo = ''
                 else:
-                    logger.info(f"scrape_job_details: Validated Company Logo URL: {company_logo}")
+                    logger.info("scrape_job_details: Validated Company Logo URL: %s", company_logo)
             except Exception as e:
-                logger.error(f"scrape_job_details: Failed to validate logo URL {company_logo}: {str(e)}")
+                logger.error("scrape_job_details: Failed to validate logo URL %s: %s", company_logo, e)
                 company_logo = ''
         else:
-            logger.warning(f"scrape_job_details: Invalid or missing logo URL: {company_logo}")
+            logger.warning("scrape_job_details: Invalid or missing logo URL: %s", company_logo)
             company_logo = '' if licensed else UNLICENSED_MESSAGE
-        logger.info(f"scrape_job_details: Scraped Company Logo URL: {company_logo}")
+        logger.info("scrape_job_details: Scraped Company Logo URL: %s", company_logo)
         
-        # Company name
-        company_name = soup.select_one(".topcard__org-name-link")
-        company_name = company_name.get_text().strip() if company_name else ''
-        logger.info(f"scrape_job_details: Scraped Company Name: {company_name}")
+        # Company name and URL both come from the top-card company link
+        company_link = soup.select_one(".topcard__org-name-link")
+        company_name = company_link.get_text().strip() if company_link else ''
+        logger.info("scrape_job_details: Scraped Company Name: %s", company_name)
         
         # Company URL
-        company_url_elem = soup.select_one(".topcard__org-name-link")
-        company_url = company_url_elem['href'] if company_url_elem and company_url_elem.get('href') else ''
-        company_url = re.sub(r'\?.*$', '', company_url) if company_url else ''
+        company_url = company_link['href'] if company_link and company_link.get('href') else ''
+        company_url = company_url.split('?', 1)[0]
         company_url = company_url if licensed else UNLICENSED_MESSAGE
-        logger.info(f"scrape_job_details: Scraped Company URL: {company_url}")
+        logger.info("scrape_job_details: Scraped Company URL: %s", company_url)
+        # Start on the company page now so it downloads while this page and the application page are handled
+        company_future = None
+        if licensed and company_url and company_url != UNLICENSED_MESSAGE:
+            company_future = COMPANY_EXECUTOR.submit(scrape_company_details, company_url)
         
         # Location
         location = soup.select_one(".topcard__flavor.topcard__flavor--bullet")
         location = location.get_text().strip() if location else 'Unknown'
-        location_parts = [part.strip() for part in location.split(',') if part.strip()]
-        location = ', '.join(dict.fromkeys(location_parts))
-        logger.info(f"scrape_job_details: Deduplicated location for {job_title}: {location}")
+        # Only a multi-part location ("Port Louis, Mauritius, Mauritius") can repeat a part
+        if ',' in location:
+            location_parts = [part.strip() for part in location.split(',') if part.strip()]
+            location = ', '.join(dict.fromkeys(location_parts))
+        logger.info("scrape_job_details: Deduplicated location for %s: %s", job_title, location)
         
         # Environment
         environment = ''
-        env_element = soup.select(".topcard__flavor--metadata")
-        for elem in env_element:
-            text = elem.get_text().strip().lower()
-            if 'remote' in text or 'hybrid' in text or 'on-site' in text:
-                environment = elem.get_text().strip()
+        for elem in soup.select(".topcard__flavor--metadata"):
+            text = elem.get_text().strip()
+            lowered = text.lower()
+            if 'remote' in lowered or 'hybrid' in lowered or 'on-site' in lowered:
+                environment = text
                 break
         environment = environment if licensed else UNLICENSED_MESSAGE
-        logger.info(f"scrape_job_details: Scraped Environment: {environment}")
+        logger.info("scrape_job_details: Scraped Environment: %s", environment)
         
         # Job type
         job_type_elem = soup.select_one(".description__job-criteria-list > li:nth-child(2) > span")
         job_type = job_type_elem.get_text().strip() if job_type_elem else ''
         job_type = FRENCH_TO_ENGLISH_JOB_TYPE.get(job_type, job_type)
-        logger.info(f"scrape_job_details: Scraped Type: {job_type}")
+        logger.info("scrape_job_details: Scraped Type: %s", job_type)
         
         # Level
         level_elem = soup.select_one(".description__job-criteria-list > li:nth-child(1) > span")
         level = level_elem.get_text().strip() if level_elem else ''
         level = level if licensed else UNLICENSED_MESSAGE
-        logger.info(f"scrape_job_details: Scraped Level: {level}")
+        logger.info("scrape_job_details: Scraped Level: %s", level)
         
         # Job functions
         job_functions_elem = soup.select_one(".description__job-criteria-list > li:nth-child(3) > span")
         job_functions = job_functions_elem.get_text().strip() if job_functions_elem else ''
         job_functions = job_functions if licensed else UNLICENSED_MESSAGE
-        logger.info(f"scrape_job_details: Scraped Job Functions: {job_functions}")
+        logger.info("scrape_job_details: Scraped Job Functions: %s", job_functions)
         
         # Industries
         industries_elem = soup.select_one(".description__job-criteria-list > li:nth-child(4) > span")
         industries = industries_elem.get_text().strip() if industries_elem else ''
         industries = industries if licensed else UNLICENSED_MESSAGE
-        logger.info(f"scrape_job_details: Scraped Industries: {industries}")
+        logger.info("scrape_job_details: Scraped Industries: %s", industries)
         
         # Job description
         job_description = ''
         description_container = soup.select_one(".show-more-less-html__markup")
-        if description_container:
+        if not description_container:
+            logger.warning("scrape_job_details: No job description container found for %s", job_title)
+        elif licensed:
             # Extract text using .get_text() with newline separator
-            raw_text = description_container.get_text(separator='\n').strip()
-            # Split into paragraphs and filter out unwanted phrases
-            unwanted_phrases = [
-                "Never Miss a Job Update Again",
-                "Don't Keep! Kindly Share:",
-                "We have started building our professional LinkedIn page"
-            ]
-            paragraphs = [para.strip() for para in raw_text.split('\n\n') if para.strip()]
-            filtered_paragraphs = [
-                para for para in paragraphs
-                if not any(phrase.lower() in para.lower() for phrase in unwanted_phrases)
-            ]
-            seen = set()
-            unique_paragraphs = []
-            logger.debug(f"scrape_job_details: Filtered paragraphs for {job_title}: {[sanitize_text(para)[:50] for para in filtered_paragraphs]}")
-            for para in filtered_paragraphs:
-                para = sanitize_text(para)
-                if not para:
-                    logger.debug(f"scrape_job_details: Skipping empty paragraph for {job_title}")
-                    continue
-                norm_para = normalize_for_deduplication(para)
-                if norm_para and norm_para not in seen:
-                    unique_paragraphs.append(para)
-                    seen.add(norm_para)
-                    logger.debug(f"scrape_job_details: Added unique paragraph: {para[:50]}...")
-                elif norm_para:
-                    logger.info(f"scrape_job_details: Removed duplicate paragraph for {job_title}: {para[:50]}...")
-            job_description = '\n\n'.join(unique_paragraphs)
-            # Clean up 'Show more/less' text and apply paragraph length limit
-            job_description = re.sub(r'(?i)(?:\s*Show\s+more\s*$|\s*Show\s+less\s*$)', '', job_description, flags=re.MULTILINE).strip()
-            job_description = split_paragraphs(job_description, max_length=200)
+            raw_text = description_container.get_text(separator='\n')
+            # Filter, clean, deduplicate and length-limit paragraphs in one streaming pass
+            job_description = split_paragraphs(iter_unique_paragraphs(raw_text, job_title), max_length=200)
             delimiter = "\n\n"
-            logger.info(f'Scraped Job Description (length): {len(job_description)}, Paragraphs: {job_description.count(delimiter) + 1}')
-        else:
-            logger.warning(f"scrape_job_details: No job description container found for {job_title}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Scraped Job Description (length): %s, Paragraphs: %s", len(job_description), job_description.count(delimiter) + 1)
+        # Unlicensed runs publish a placeholder, so their description text is never built
         job_description = job_description if licensed else UNLICENSED_MESSAGE
-        logger.debug(f"scrape_job_details: Set job_description={'(actual content)' if job_description else UNLICENSED_MESSAGE}")
+        logger.debug("scrape_job_details: Set job_description=%s", '(actual content)' if job_description else UNLICENSED_MESSAGE)
         
         # Application info from description (always scrape, regardless of license)
         description_application_info = ''
         description_application_url = ''
         if job_description and job_description != UNLICENSED_MESSAGE:
-            email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-            emails = re.findall(email_pattern, job_description)
-            if emails:
-                description_application_info = emails[0]
-                logger.info(f"scrape_job_details: Found email in job description: {description_application_info}")
+            description_application_info = find_email(job_description)
+            if description_application_info:
+                logger.info("scrape_job_details: Found email in job description: %s", description_application_info)
             else:
                 links = description_container.find_all('a', href=True) if description_container else []
                 for link in links:
@@ -512,65 +827,52 @@ def scrape_job_details(job_url, licensed, session):
                     if 'apply' in href.lower() or 'careers' in href.lower() or 'jobs' in href.lower():
                         description_application_url = href
                         description_application_info = href
-                        logger.info(f"scrape_job_details: Found application link in job description: {description_application_info}")
+                        logger.info("scrape_job_details: Found application link in job description: %s", description_application_info)
                         break
         
         # Application URL (always scrape, regardless of license)
         application_url = ''
         application_anchor = soup.select_one("#teriary-cta-container > div > a")
         application_url = application_anchor['href'] if application_anchor and application_anchor.get('href') else ''
-        logger.info(f"scrape_job_details: Scraped Application URL: {application_url}")
+        logger.info("scrape_job_details: Scraped Application URL: %s", application_url)
         
         # Resolve application URL (always attempt, regardless of license)
         resolved_application_info = ''
         resolved_application_url = ''
         if application_url:
-            logger.debug(f"scrape_job_details: Following application URL: {application_url}")
+            logger.debug("scrape_job_details: Following application URL: %s", application_url)
             try:
-                time.sleep(5)
-                resp_app = session.get(application_url, headers=headers, timeout=15, allow_redirects=True)
-                logger.debug(f"scrape_job_details: Application URL GET response status={resp_app.status_code}, headers={resp_app.headers}, final_url={resp_app.url}")
-                resolved_application_url = resp_app.url
-                logger.info(f"scrape_job_details: Resolved Application URL: {resolved_application_url}")
-                app_soup = BeautifulSoup(resp_app.text, 'html.parser')
-                email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-                emails = re.findall(email_pattern, resp_app.text)
-                if emails:
-                    resolved_application_info = emails[0]
-                    logger.info(f"scrape_job_details: Found email in application page: {resolved_application_info}")
+                throttle_host(application_url)
+                with SESSION.get(application_url, timeout=15, allow_redirects=True, stream=True) as resp_app:
+                    logger.debug("scrape_job_details: Application URL GET response status=%s, headers=%s, final_url=%s", resp_app.status_code, resp_app.headers, resp_app.url)
+                    resolved_application_url = resp_app.url
+                    logger.info("scrape_job_details: Resolved Application URL: %s", resolved_application_url)
+                    # Scan the raw bytes first (this also catches mailto: links); only parse the page when no email is found
+                    resolved_application_info, app_content = find_email_in_stream(resp_app)
+                if resolved_application_info:
+                    logger.info("scrape_job_details: Found email in application page: %s", resolved_application_info)
                 else:
-                    links = app_soup.find_all('a', href=True)
-                    for link in links:
-                        href = link['href']
-                        if 'apply' in href.lower() or 'careers' in href.lower() or 'jobs' in href.lower():
-                            resolved_application_info = href
-                            logger.info(f"scrape_job_details: Found application link in application page: {resolved_application_info}")
-                            break
+                    resolved_application_info = find_application_link(app_content)
+                    if resolved_application_info:
+                        logger.info("scrape_job_details: Found application link in application page: %s", resolved_application_info)
             except Exception as e:
-                logger.error(f"scrape_job_details: Failed to follow application URL redirect: {str(e)}", exc_info=True)
+                logger.error("scrape_job_details: Failed to follow application URL redirect: %s", e, exc_info=True)
                 error_str = str(e)
-                external_url_match = re.search(r'host=\'([^\']+)\'', error_str)
+                external_url_match = ERROR_HOST_RE.search(error_str)
                 if external_url_match:
                     external_url = external_url_match.group(1)
                     resolved_application_url = f"https://{external_url}"
-                    logger.info(f"scrape_job_details: Extracted external URL from error for application: {resolved_application_url}")
+                    logger.info("scrape_job_details: Extracted external URL from error for application: %s", resolved_application_url)
                 else:
                     resolved_application_url = description_application_url if description_application_url else application_url
-                    logger.warning(f"scrape_job_details: No external URL found in error, using fallback: {resolved_application_url}")
+                    logger.warning("scrape_job_details: No external URL found in error, using fallback: %s", resolved_application_url)
         
         # Final application details (always set, regardless of license)
-        final_application_email = description_application_info if description_application_info and '@' in description_application_info else ''
-        final_application_url = description_application_url if description_application_url else ''
-        if final_application_email and resolved_application_info and '@' in resolved_application_info:
-            final_application_email = final_application_email if final_application_email == resolved_application_info else final_application_email
-        elif resolved_application_info and '@' in resolved_application_info:
-            final_application_email = final_application_email or resolved_application_info
-            logger.debug(f"scrape_job_details: Set final_application_email={final_application_email}")
-        if description_application_url and resolved_application_url:
-            final_application_url = description_application_url if description_application_url == resolved_application_url else resolved_application_url
-        elif resolved_application_url:
-            final_application_url = resolved_application_url
-        logger.debug(f"scrape_job_details: Set final_application_url={final_application_url}")
+        # An email from the description wins over one found on the application page; a resolved URL wins over the raw one
+        final_application_email = next((info for info in (description_application_info, resolved_application_info) if info and '@' in info), '')
+        final_application_url = resolved_application_url or description_application_url or ''
+        logger.debug("scrape_job_details: Set final_application_email=%s", final_application_email)
+        logger.debug("scrape_job_details: Set final_application_url=%s", final_application_url)
         
         # Company details
         company_details = ''
@@ -582,135 +884,22 @@ def scrape_job_details(job_url, licensed, session):
         company_founded = ''
         company_specialties = ''
         company_address = ''
-        if licensed and company_url and company_url != UNLICENSED_MESSAGE:
-            logger.info(f"scrape_job_details: Fetching company page: {company_url}")
+        company_scraped = False
+        if company_future is not None:
             try:
-                # Attempt to fetch company page with retry
-                for attempt in range(3):
-                    try:
-                        company_response = session.get(company_url, headers=headers, timeout=15)
-                        logger.debug(f"scrape_job_details: Company page GET response status={company_response.status_code}, headers={company_response.headers}")
-                        company_response.raise_for_status()
-                        break
-                    except requests.exceptions.RequestException as e:
-                        logger.warning(f"scrape_job_details: Attempt {attempt + 1} failed for company page {company_url}: {str(e)}")
-                        if attempt == 2:
-                            raise
-                        time.sleep(2)
-                company_soup = BeautifulSoup(company_response.text, 'html.parser')
-                
-                # Scrape company details using data-test-id
-                company_details_elem = company_soup.select_one("p[data-test-id='about-us__description']")
-                company_details = company_details_elem.get_text().strip() if company_details_elem else ''
-                logger.info(f"scrape_job_details: Scraped Company Details: {company_details[:100] + '...' if company_details else ''}")
-                
-                # Scrape website using data-test-id
-                website_div = company_soup.select_one("div[data-test-id='about-us__website']")
-                company_website_anchor = website_div.select_one("dd a") if website_div else None
-                company_website_url = company_website_anchor['href'] if company_website_anchor and company_website_anchor.get('href') else ''
-                logger.info(f"scrape_job_details: Scraped Company Website URL: {company_website_url}")
-                
-                # Handle LinkedIn redirect URLs
-                if 'linkedin.com/redir/redirect' in company_website_url:
-                    parsed_url = urlparse(company_website_url)
-                    query_params = parse_qs(parsed_url.query)
-                    if 'url' in query_params:
-                        company_website_url = unquote(query_params['url'][0])
-                        logger.info(f"scrape_job_details: Extracted external company website from redirect: {company_website_url}")
-                    else:
-                        logger.warning(f"scrape_job_details: No 'url' param in LinkedIn redirect for {company_name}")
-                
-                # Resolve external company website
-                if company_website_url and 'linkedin.com' not in company_website_url:
-                    logger.debug(f"scrape_job_details: Following company website URL: {company_website_url}")
-                    try:
-                        time.sleep(5)
-                        resp_company_web = session.get(company_website_url, headers=headers, timeout=15, allow_redirects=True)
-                        logger.debug(f"scrape_job_details: Company website GET response status={resp_company_web.status_code}, headers={resp_company_web.headers}, final_url={resp_company_web.url}")
-                        company_website_url = resp_company_web.url
-                        logger.info(f"scrape_job_details: Resolved Company Website URL: {company_website_url}")
-                    except Exception as e:
-                        logger.error(f"scrape_job_details: Failed to resolve company website URL: {str(e)}", exc_info=True)
-                        error_str = str(e)
-                        external_url_match = re.search(r'host=\'([^\']+)\'', error_str)
-                        if external_url_match:
-                            external_url = external_url_match.group(1)
-                            company_website_url = f"https://{external_url}"
-                            logger.info(f"scrape_job_details: Extracted external URL from error for company website: {company_website_url}")
-                        else:
-                            logger.warning(f"scrape_job_details: No external URL found in error for {company_name}")
-                            company_website_url = ''
-                else:
-                    # Try to find website in company description
-                    if company_details:
-                        url_pattern = r'https?://(?!www\.linkedin\.com)[^\s]+'
-                        urls = re.findall(url_pattern, company_details)
-                        if urls:
-                            company_website_url = urls[0]
-                            logger.info(f"scrape_job_details: Found company website in description: {company_website_url}")
-                            try:
-                                time.sleep(5)
-                                resp_company_web = session.get(company_website_url, headers=headers, timeout=15, allow_redirects=True)
-                                logger.debug(f"scrape_job_details: Company website description GET response status={resp_company_web.status_code}, headers={resp_company_web.headers}, final_url={resp_company_web.url}")
-                                company_website_url = resp_company_web.url
-                                logger.info(f"scrape_job_details: Resolved Company Website URL from description: {company_website_url}")
-                            except Exception as e:
-                                logger.error(f"scrape_job_details: Failed to resolve company website URL from description: {str(e)}", exc_info=True)
-                                company_website_url = ''
-                        else:
-                            logger.warning(f"scrape_job_details: No valid company website URL found in description for {company_name}")
-                            company_website_url = ''
-                    else:
-                        logger.warning(f"scrape_job_details: No company description found for {company_name}")
-                        company_website_url = ''
-                
-                # Skip LinkedIn URLs
-                if company_website_url and 'linkedin.com' in company_website_url:
-                    logger.warning(f"scrape_job_details: Skipping LinkedIn URL for company website: {company_website_url}")
-                    company_website_url = ''
-                
-                # Helper function to get company details
-                def get_company_detail(label):
-                    logger.debug(f"scrape_job_details: get_company_detail called with label={label}")
-                    div_selector = f"div[data-test-id='about-us__{label.lower()}']"
-                    detail_div = company_soup.select_one(div_selector)
-                    if detail_div:
-                        dd = detail_div.select_one("dd")
-                        value = dd.get_text().strip() if dd else ''
-                        logger.debug(f"scrape_job_details: Found {label}='{value}'")
-                        return value
-                    logger.debug(f"scrape_job_details: No {label} found with selector {div_selector}")
-                    return ''
-                
-                company_industry = get_company_detail("industry")
-                logger.info(f"scrape_job_details: Scraped Company Industry: {company_industry}")
-                company_size = get_company_detail("size")
-                logger.info(f"scrape_job_details: Scraped Company Size: {company_size}")
-                company_headquarters = get_company_detail("headquarters")
-                logger.info(f"scrape_job_details: Scraped Company Headquarters: {company_headquarters}")
-                company_type = get_company_detail("organizationType")
-                logger.info(f"scrape_job_details: Scraped Company Type: {company_type}")
-                company_founded = get_company_detail("foundedOn")
-                logger.info(f"scrape_job_details: Scraped Company Founded: {company_founded}")
-                company_specialties = get_company_detail("specialties")
-                logger.info(f"scrape_job_details: Scraped Company Specialties: {company_specialties}")
-                
-                # For address, get primary location
-                primary_li = company_soup.select_one("li span.tag-sm.tag-enabled")
-                if primary_li:
-                    address_div = primary_li.find_next_sibling("div")
-                    if address_div:
-                        company_address = address_div.get_text(separator=', ').strip()
-                        logger.info(f"scrape_job_details: Scraped Primary Company Address: {company_address}")
-                    else:
-                        company_address = company_headquarters
-                        logger.warning(f"scrape_job_details: No address div found, using headquarters: {company_address}")
-                else:
-                    company_address = company_headquarters
-                    logger.warning(f"scrape_job_details: No primary location found, using headquarters: {company_address}")
-            
+                company_info = company_future.result()
+                company_details = company_info["company_details"]
+                company_website_url = company_info["company_website_url"]
+                company_industry = company_info["company_industry"]
+                company_size = company_info["company_size"]
+                company_headquarters = company_info["company_headquarters"]
+                company_type = company_info["company_type"]
+                company_founded = company_info["company_founded"]
+                company_specialties = company_info["company_specialties"]
+                company_address = company_info["company_address"]
+                company_scraped = True
             except Exception as e:
-                logger.error(f"scrape_job_details: Error fetching company page: {company_url} - {str(e)}", exc_info=True)
+                logger.error("scrape_job_details: Error fetching company page: %s - %s", company_url, e, exc_info=True)
                 company_details = ''
                 company_website_url = ''
                 company_industry = ''
@@ -730,48 +919,96 @@ def scrape_job_details(job_url, licensed, session):
             company_founded = UNLICENSED_MESSAGE
             company_specialties = UNLICENSED_MESSAGE
             company_address = UNLICENSED_MESSAGE
-            logger.debug(f"scrape_job_details: Unlicensed or no company URL, set company fields to {UNLICENSED_MESSAGE}")
+            logger.debug("scrape_job_details: Unlicensed or no company URL, set company fields to %s", UNLICENSED_MESSAGE)
         
-        # Return structured row data
-        row = [
-            job_title,
-            company_logo,
-            company_name,
-            company_url,
-            location,
-            environment,
-            job_type,
-            level,
-            job_functions,
-            industries,
-            job_description,
-            job_url,
-            company_details,
-            company_website_url,
-            company_industry,
-            company_size,
-            company_headquarters,
-            company_type,
-            company_founded,
-            company_specialties,
-            company_address,
-            application_url,
-            description_application_info,
-            resolved_application_info,
-            final_application_email,
-            final_application_url,
-            resolved_application_url
-        ]
-        logger.info(f"scrape_job_details: Full scraped row for job: {str(row)[:200]}...")
-        return row
+        # Return the job fields keyed by name
+        job_data = {
+            "job_title": job_title,
+            "company_logo": company_logo,
+            "company_name": company_name,
+            "company_url": company_url,
+            "location": location,
+            "environment": environment,
+            "job_type": job_type,
+            "level": level,
+            "job_functions": job_functions,
+            "industries": industries,
+            "job_description": job_description,
+            "job_url": job_url,
+            "company_details": company_details,
+            "company_website_url": company_website_url,
+            "company_industry": company_industry,
+            "company_size": company_size,
+            "company_headquarters": company_headquarters,
+            "company_type": company_type,
+            "company_founded": company_founded,
+            "company_specialties": company_specialties,
+            "company_address": company_address,
+            "application_url": application_url,
+            "description_application_info": description_application_info,
+            "resolved_application_info": resolved_application_info,
+            "final_application_email": final_application_email,
+            "final_application_url": final_application_url,
+            "resolved_application_url": resolved_application_url,
+            "company_scraped": company_scraped
+        }
+        logger.info("scrape_job_details: Scraped job %s at %s", job_title, company_name)
+        return job_data
         
     except Exception as e:
-        logger.error(f"scrape_job_details: Error in scrape_job_details for {job_url}: {str(e)}", exc_info=True)
+        logger.error("scrape_job_details: Error in scrape_job_details for %s: %s", job_url, e, exc_info=True)
         return None
 
-def crawl(wp_headers, processed_ids, licensed):
+def process_job(index, job_url, processed_ids, licensed):
+    """Scrape one job; returns (status, job_id, job_dict) with job_dict set only when it is ready to save"""
+    job_dict = scrape_job_details(job_url, licensed)
+    if not job_dict:
+        return "invalid", None, None
+    
+    job_dict["job_salary"] = ""
+    
+    job_title = job_dict.get("job_title", "")
+    company_name = job_dict.get("company_name", "")
+    
+    if not job_title or not company_name:
+        logger.warning("Skipping job with missing title or company: %s - %s", job_title, company_name)
+        return "invalid", None, None
+    
+    job_id = generate_id(f"{job_title}_{company_name}")
+    
+    if job_id in processed_ids:
+        logger.info("Skipping already processed job: %s", job_id)
+        return "duplicate", job_id, None
+    
+    time.sleep(random.uniform(2, 5))  # Rate limiting
+    return "scraped", job_id, job_dict
+
+def save_job_to_wordpress(index, job_dict, job_id, licensed):
+    """Save a scraped job and its company to WordPress; returns (status, job_id)"""
+    # Save company
+    company_id, company_msg = save_company_to_wordpress(index, job_dict, licensed)
+    if not company_id:
+        logger.error("Failed to save company: %s", company_msg)
+        return "failed", job_id
+    
+    # Save job
+    job_post_id, job_msg = save_article_to_wordpress(index, job_dict, job_id, company_id, licensed)
+    return ("saved" if job_post_id else "failed"), job_id
+
+def fetch_search_page(page):
+    """Fetch one LinkedIn search results page after a randomised delay"""
+    url = build_search_url(page)
+    logger.info("Fetching page %s: %s", page, url)
+    
+    time.sleep(random.uniform(3, 7))  # Reduced delay for testing
+    
+    response = SESSION.get(url, timeout=20)
+    response.raise_for_status()
+    return response
+
+def crawl(processed_ids, licensed):
     """Main crawling function"""
-    logger.info(f"Starting crawl for country={COUNTRY}, keyword={KEYWORD or 'ALL JOBS'}, licensed={licensed}")
+    logger.info("Starting crawl for country=%s, keyword=%s, licensed=%s", COUNTRY, KEYWORD or 'ALL JOBS', licensed)
     
     success_count = 0
     failure_count = 0
@@ -779,101 +1016,114 @@ def crawl(wp_headers, processed_ids, licensed):
     start_page = load_last_page()
     pages_to_scrape = 100  # Reduced for testing
     
-    session = requests.Session()
-    retries = Retry(total=3, backoff_factor=1, status_forcelist=[429, 500, 502, 503, 504])
-    session.mount('https://', HTTPAdapter(max_retries=retries))
+    end_page = start_page + pages_to_scrape
+    next_page = None
     
-    for i in range(start_page, start_page + pages_to_scrape):
-        url = build_search_url(i)
-        logger.info(f"Fetching page {i}: {url}")
-        
-        time.sleep(random.uniform(3, 7))  # Reduced delay for testing
-        
-        try:
-            response = session.get(url, headers=headers, timeout=20)
-            response.raise_for_status()
-            
-            if "login" in response.url.lower() or "challenge" in response.url.lower():
-                logger.error("Login or CAPTCHA detected, stopping crawl")
-                break
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            job_list = soup.select("ul.jobs-search__results-list li a")
-            urls = [a['href'] for a in job_list if a.get('href') and 'jobs/view' in a['href']]
+    # One background worker fetches the next search page while the current page's jobs are processed
+    with open_processed_ids_log() as processed_ids_log, \
+            open_last_page_file() as last_page_file, \
+            ThreadPoolExecutor(max_workers=1) as page_fetcher, \
+            ThreadPoolExecutor(max_workers=JOB_WORKERS) as job_executor, \
+            ThreadPoolExecutor(max_workers=WP_WORKERS) as wp_executor:
+        for i in range(start_page, end_page):
+            if next_page is None:
+                next_page = page_fetcher.submit(fetch_search_page, i)
+            page_future, next_page = next_page, None
             
-            logger.info(f"Found {len(urls)} job URLs on page {i}")
-            
-            if not urls:
-                logger.warning(f"No jobs found on page {i}, possibly end of results")
-                break
-            
-            for index, job_url in enumerate(urls):  # Process all jobs on the page
-                logger.info(f"Processing job {index + 1}/{len(urls)}: {job_url}")
+            try:
+                response = page_future.result()
                 
-                job_data = scrape_job_details(job_url, licensed, session)
-                if not job_data:
-                    failure_count += 1
-                    continue
+                if "login" in response.url.lower() or "challenge" in response.url.lower():
+                    logger.error("Login or CAPTCHA detected, stopping crawl")
+                    break
                 
-                job_dict = dict(zip([
-                    "job_title", "company_logo", "company_name", "company_url", "location",
-                    "environment", "job_type", "level", "job_functions", "industries",
-                    "job_description", "job_url", "company_details", "company_website_url",
-                    "company_industry", "company_size", "company_headquarters", "company_type",
-                    "company_founded", "company_specialties", "company_address", "application_url",
-                    "description_application_info", "resolved_application_info", "final_application_email",
-                    "final_application_url", "resolved_application_url"
-                ], job_data))
-                job_dict["job_salary"] = ""
+                soup = parse_html(response, SEARCH_RESULTS_STRAINER)
+                # Pair each job URL with the ID derived from its search card's title and company,
+                # so already processed jobs are skipped without downloading the job page
+                urls = []
+                for card in soup.select("ul.jobs-search__results-list li"):
+                    card_title = card.select_one("h3.base-search-card__title")
+                    card_company = card.select_one("h4.base-search-card__subtitle")
+                    card_job_id = generate_id(f"{card_title.get_text().strip()}_{card_company.get_text().strip()}") if card_title and card_company else None
+                    for a in card.select("a"):
+                        if a.get('href') and 'jobs/view' in a['href']:
+                            urls.append((a['href'], card_job_id))
                 
-                job_title = job_dict.get("job_title", "")
-                company_name = job_dict.get("company_name", "")
+                logger.info("Found %s job URLs on page %s", len(urls), i)
                 
-                if not job_title or not company_name:
-                    logger.warning(f"Skipping job with missing title or company: {job_title} - {company_name}")
-                    failure_count += 1
-                    continue
+                if not urls:
+                    logger.warning("No jobs found on page %s, possibly end of results", i)
+                    break
                 
-                job_id = generate_id(f"{job_title}_{company_name}")
+                if i + 1 < end_page:
+                    next_page = page_fetcher.submit(fetch_search_page, i + 1)
                 
-                if job_id in processed_ids:
-                    logger.info(f"Skipping already processed job: {job_id}")
-                    total_jobs += 1
-                    continue
+                # Scrape and save the page's jobs concurrently; counters are tallied from the results
+                queued_ids = set()
+                pending = {}
+                for index, (job_url, card_job_id) in enumerate(urls):  # Process all jobs on the page
+                    logger.info("Processing job %s/%s: %s", index + 1, len(urls), job_url)
+                    
+                    if card_job_id in processed_ids or card_job_id in queued_ids:
+                        logger.info("Skipping already processed job: %s", card_job_id)
+                        total_jobs += 1
+                        continue
+                    if card_job_id:
+                        queued_ids.add(card_job_id)
+                    
+                    pending[job_executor.submit(process_job, index, job_url, processed_ids, licensed)] = index
                 
-                total_jobs += 1
+                # Hand each job to the WordPress workers as soon as its scrape finishes
+                saves = []
+                seen_ids = set()
+                for future in as_completed(pending):
+                    try:
+                        status, job_id, job_dict = future.result()
+                    except Exception as e:
+                        logger.error("Error scraping job on page %s: %s", i, e, exc_info=True)
+                        failure_count += 1
+                        continue
+                    
+                    if status == "invalid":
+                        failure_count += 1
+                        continue
+                    
+                    total_jobs += 1
+                    if status == "scraped" and (job_id in processed_ids or job_id in seen_ids):
+                        logger.info("Skipping duplicate job on page %s: %s", i, job_id)
+                    elif status == "scraped":
+                        seen_ids.add(job_id)
+                        saves.append(wp_executor.submit(save_job_to_wordpress, pending[future], job_dict, job_id, licensed))
                 
-                # Save company
-                company_id, company_msg = save_company_to_wordpress(index, job_dict, wp_headers, licensed)
-                if not company_id:
-                    logger.error(f"Failed to save company: {company_msg}")
-                    failure_count += 1
-                    continue
+                page_saved = 0
+                for future in saves:
+                    try:
+                        status, job_id = future.result()
+                    except Exception as e:
+                        logger.error("Error saving job on page %s: %s", i, e, exc_info=True)
+                        failure_count += 1
+                        continue
+                    
+                    if status == "saved":
+                        processed_ids.add(job_id)
+                        processed_ids_log.write(f"{job_id}\n")
+                        success_count += 1
+                        page_saved += 1
+                    else:
+                        failure_count += 1
                 
-                # Save job
-                job_post_id, job_msg = save_article_to_wordpress(index, job_dict, company_id, wp_headers, licensed)
+                logger.info("Page %s done: saved %s of %s new jobs (%s listed)", i, page_saved, len(saves), len(urls))
                 
-                if job_post_id:
-                    processed_ids.add(job_id)
-                    success_count += 1
-                    emoji = "🔓" if licensed else "🔒"
-                    print(f"{emoji} Saved: {job_title} at {company_name}")
-                else:
-                    failure_count += 1
-                    print(f"✗ Failed: {job_title} at {company_name} - {job_msg}")
+                # Persist this page's IDs before marking the page as done
+                processed_ids_log.flush()
+                save_last_page(last_page_file, i + 1)
                 
-                time.sleep(random.uniform(2, 5))  # Rate limiting
-            
-            save_last_page(i + 1)
-            
-        except Exception as e:
-            logger.error(f"Error processing page {i}: {str(e)}")
-            failure_count += 1
-            continue
-    
-    save_processed_ids(processed_ids)
+            except Exception as e:
+                logger.error("Error processing page %s: %s", i, e)
+                failure_count += 1
+                continue
     
-    logger.info(f"Crawl completed: Total={total_jobs}, Success={success_count}, Failed={failure_count}")
+    logger.info("Crawl completed: Total=%s, Success=%s, Failed=%s", total_jobs, success_count, failure_count)
     print(f"\n=== SUMMARY ===")
     print(f"Total jobs processed: {total_jobs}")
     print(f"Successfully saved: {success_count}")
@@ -894,25 +1144,25 @@ def main():
         # FIXED: Check license with proper LICENSE_KEY validation
         licensed = get_license_status()
         
-        # Create WP headers
-        wp_headers = create_wp_auth_headers()
+        # Attach WP auth headers to the WordPress session once
+        WP_SESSION.headers.update(create_wp_auth_headers())
         
         # Load processed IDs
         processed_ids = load_processed_ids()
         print(f"📋 Found {len(processed_ids)} previously processed jobs")
         
         # Start crawling
-        crawl(wp_headers, processed_ids, licensed)
+        crawl(processed_ids, licensed)
         
         print("✅ Job fetcher completed!")
         logger.info("Job fetcher completed successfully")
         
     except ValueError as ve:
-        logger.error(f"Configuration error: {str(ve)}")
+        logger.error("Configuration error: %s", ve)
         print(f"❌ Configuration error: {str(ve)}")
         sys.exit(1)
     except Exception as e:
-        logger.error(f"Fatal error: {str(e)}", exc_info=True)
+        logger.error("Fatal error: %s", e, exc_info=True)
         print(f"❌ Fatal error: {str(e)}")
         sys.exit(1)
 